@@ -334,8 +334,11 @@ class _Recorder:
                 'ch_names': sr.streams[stream].ch_list,
                 'lsl_time_offset': sr.streams[stream].lsl_time_offset}
 
+            # protocol 5 (PEP 574, python 3.8+) pickles the arrays as buffers,
+            # which are loaded without an extra copy.
             with open(pcl_files[stream], 'wb') as file:
-                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, file,
+                            protocol=min(5, pickle.HIGHEST_PROTOCOL))
 
             logger.info("Saved to '%s'", pcl_files[stream])
 
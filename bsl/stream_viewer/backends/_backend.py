@@ -1,10 +1,12 @@
-import copy
-import math
-import queue
-import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+
+import numpy as np
 
 from ...utils._docs import fill_doc
+from ...utils._logs import logger
 
 
 @fill_doc
@@ -29,31 +31,37 @@ class _Backend(ABC):
         self._yRange = yRange  # amplitude range in uV
 
         self._show_LPT_trigger_events = False
-        self._selected_channels = copy.deepcopy(self._scope.selected_channels)
+        self._selected_channels = list(self._scope.selected_channels)
 
         # Trigger and annotations
-        self._trigger_events = list()
+        self._trigger_events = _EventBuffer()
         self._annotations = list()
         # if not None, a recorder is started and recording
         self._recorder_annotation_file = None
-        self._AnnotationQueue = queue.Queue()
-        self._AnnotationThread = threading.Thread(
-            target=self._write_annotation_to_disk, args=(), daemon=True)
+        self._AnnotationQueue = _SPSCRing()
+        # annotations are written outside of the GUI loop by a single worker
+        self._AnnotationExecutor = ThreadPoolExecutor(max_workers=1)
+        self._AnnotationFuture = None
 
     def _init_variables(self):
         """
         Initialize variables depending on xRange, yRange and selected_channels.
         """
+        scope = self._scope
+        xRange = self._xRange
+
         # xRange
-        self._delta_with_buffer = self._scope.duration_buffer - self._xRange
-        self._duration_plot_samples = math.ceil(
-            self._xRange*self._scope.sample_rate)
+        self._delta_with_buffer = scope.duration_buffer - xRange
+        duration_plot = xRange * scope.sample_rate
+        self._duration_plot_samples = \
+            int(duration_plot) + (1 if duration_plot % 1 else 0)
 
     # -------------------------- Main Loop -------------------------
     @abstractmethod
     def start_timer(self):
         """
-        Start the update loop on a 20 ms timer.
+        Start the update loop on a 20 ms timer. The timer should have a
+        millisecond accuracy to avoid jitter in the display.
         """
         pass
 
@@ -65,25 +73,69 @@ class _Backend(ABC):
         """
         self._scope.update_loop()
 
+        # hand the queued annotations to the writer if it is idle
+        if not self._AnnotationQueue.empty() and \
+                (self._AnnotationFuture is None or
+                 self._AnnotationFuture.done()):
+            self._AnnotationFuture = self._submit_annotation_writer()
+
     # -------------------------- Annotations -----------------------
     def _clean_up_annotations(self):
         """
         Remove annotations exiting the buffer.
         """
-        for k in range(len(self._annotations)-1, -1, -1):
-            if self._annotations[k].position_buffer < 0:
-                del self._annotations[k]
+        if len(self._annotations) == 0:
+            return
+        self._annotations = [annot for annot in self._annotations
+                             if not annot._exited_buffer()]
+
+    def _queue_annotation(self, onset, duration, description):
+        """
+        Add an annotation to the queue of annotations to save. If the writer
+        stalls and the queue is full, the annotation is dropped.
+        """
+        if not self._AnnotationQueue.put((onset, duration, description)):
+            logger.warning(
+                "Annotation queue is full. The annotation '%s' at %.3f is "
+                "dropped.", description, onset)
+
+    def _submit_annotation_writer(self):
+        """
+        Submit _write_annotation_to_disk to the writer executor. The errors
+        raised by the writer are logged.
+        """
+        future = self._AnnotationExecutor.submit(
+            self._write_annotation_to_disk)
+        future.add_done_callback(_log_annotation_writer_error)
+        return future
 
     def _write_annotation_to_disk(self):
         """
-        Method called in second thread pulling annotations from queue and
-        saving them. Annotations are only saved when they exit the buffer.
+        Method called by the writer executor pulling annotations from queue
+        and saving them. Annotations are only saved when they exit the buffer.
         """
-        if self._recorder_annotation_file is not None:
-            onset, duration, description = self._AnnotationQueue.get()
-            self._recorder_annotation_file.write(
-                "%s %s %s\n" % (onset, duration, description))
-            self._AnnotationQueue.task_done()
+        # drain every available annotation and write them at once
+        annotations = self._AnnotationQueue.get_all()
+        if len(annotations) != 0 and \
+                self._recorder_annotation_file is not None:
+            self._recorder_annotation_file.write("".join(
+                f"{onset:.6f} {duration:.6f} {description}\n"
+                for onset, duration, description in annotations))
+            self._recorder_annotation_file.flush()
+
+    def _flush_annotations(self, timeout=None):
+        """
+        Save the annotations remaining in the queue and wait for the writer.
+        Returns False if the writer did not finish within timeout seconds.
+        """
+        future = self._AnnotationFuture = self._submit_annotation_writer()
+        wait([future], timeout=timeout)
+        if not future.done():
+            logger.warning(
+                'The annotations are still being saved after %s seconds.',
+                timeout)
+            return False
+        return True
 
     # ------------------------ Trigger Events ----------------------
     @abstractmethod
@@ -95,13 +147,31 @@ class _Backend(ABC):
         """
         pass
 
+    def _add_trigger_events(self, events):
+        """
+        Add new trigger events entering the buffer.
+        """
+        self._trigger_events.extend(events)
+
+    def _shift_trigger_events(self, delta):
+        """
+        Shift the trigger events by delta seconds toward the start of the
+        buffer.
+        """
+        if len(self._trigger_events) != 0:
+            self._trigger_events.shift(delta)
+
     def _clean_up_trigger_events(self):
         """
-        Remove events exiting the buffer.
+        Remove events exiting the buffer. The events are not kept while they
+        are not displayed.
         """
-        for k in range(len(self._trigger_events)-1, -1, -1):
-            if self._trigger_events[k].position_buffer < 0:
-                del self._trigger_events[k]
+        if len(self._trigger_events) == 0:
+            return
+        if not self._show_LPT_trigger_events:
+            self._trigger_events.clear()
+            return
+        self._trigger_events.clean_up()
 
     # --------------------------- Events ---------------------------
     @abstractmethod
@@ -109,7 +179,16 @@ class _Backend(ABC):
         """
         Stops the update loop and close the window.
         """
-        pass
+        # save the remaining annotations, without blocking on a stalled
+        # writer, and terminate the writer
+        if not self._flush_annotations(timeout=1) and \
+                self._AnnotationFuture.cancel():
+            # the flush did not start, the annotations are still in queue
+            for onset, duration, description in \
+                    self._AnnotationQueue.get_all():
+                logger.warning("Annotation '%s' at %.3f was not saved.",
+                               description, onset)
+        self._AnnotationExecutor.shutdown(wait=False)
 
     # ------------------------- Properties -------------------------
     @property
@@ -184,6 +263,195 @@ class _Backend(ABC):
         pass
 
 
+def _log_annotation_writer_error(future):
+    """
+    Done callback of the annotation writer futures, logging the error raised
+    by the writer, if any.
+    """
+    if future.cancelled():
+        return
+    exception = future.exception()
+    if exception is not None:
+        logger.error('Annotations could not be saved: %s', exception,
+                     exc_info=exception)
+
+
+class _SPSCRing:
+    """
+    Fixed-size single-producer/single-consumer ring buffer.
+
+    The producer (GUI thread) only moves the tail and the consumer (writer
+    thread) only moves the head, thus put/get do not require a lock.
+
+    Parameters
+    ----------
+    size : int
+        Number of slots. Must be a power of 2.
+    """
+
+    def __init__(self, size=1024):
+        assert 0 < size and size & (size - 1) == 0
+        self._buffer = [None] * size
+        self._mask = size - 1
+        self._head = 0  # next slot to read, only moved by the consumer
+        self._tail = 0  # next slot to write, only moved by the producer
+
+    def put(self, item):
+        """
+        Add an item to the ring. Returns False if the ring is full, in which
+        case the item is not added.
+        """
+        if self._mask < self._tail - self._head:
+            return False
+        self._buffer[self._tail & self._mask] = item
+        self._tail += 1
+        return True
+
+    def get_all(self):
+        """
+        Remove and return all the available items, oldest first.
+        """
+        items = list()
+        tail = self._tail
+        while self._head != tail:
+            idx = self._head & self._mask
+            items.append(self._buffer[idx])
+            self._buffer[idx] = None
+            self._head += 1
+        return items
+
+    def empty(self):
+        """
+        True if the ring is empty.
+        """
+        return self._head == self._tail
+
+
+class _EventBuffer:
+    """
+    Preallocated buffer storing the trigger events in order of arrival.
+
+    The live events are stored between head and tail, and their positions in
+    the scope's buffer and the offsets to their positions in the plotting
+    window are stored in contiguous arrays, indexed by the events, to shift
+    all events at once with a single store. Since all events are shifted by
+    the same amount, the events exiting the buffer are always at the head,
+    and removing them only advances the head. The live
+    events are moved back to the front of the buffer when the tail reaches
+    the end.
+
+    Parameters
+    ----------
+    capacity : int
+        Initial number of slots. The buffer grows if more events are live.
+    """
+
+    def __init__(self, capacity=4096):
+        self._events = [None] * capacity
+        self._position_buffer = np.zeros(capacity)
+        self._plot_offset = np.zeros(capacity)
+        self._head = 0
+        self._tail = 0
+
+    def extend(self, events):
+        """
+        Add new events entering the buffer.
+        """
+        n = len(events)
+        if len(self._events) < self._tail + n:
+            self._reserve(n)
+        self._events[self._tail:self._tail+n] = events
+        self._position_buffer[self._tail:self._tail+n] = [
+            event.position_buffer for event in events]
+        self._plot_offset[self._tail:self._tail+n] = [
+            event._plot_offset for event in events]
+        for k, event in enumerate(events, start=self._tail):
+            event._buffer = self
+            event._index = k
+        self._tail += n
+
+    def _reserve(self, n):
+        """
+        Move the live events to the front of the buffer, and grow the buffer
+        if it can not store n additional events.
+        """
+        size = self._tail - self._head
+        capacity = len(self._events)
+        while capacity < size + n:
+            capacity *= 2
+        events = self._events[self._head:self._tail]
+        position_buffer = self._position_buffer[self._head:self._tail].copy()
+        plot_offset = self._plot_offset[self._head:self._tail].copy()
+        if capacity != len(self._events):
+            self._position_buffer = np.zeros(capacity)
+            self._plot_offset = np.zeros(capacity)
+        self._events = events + [None] * (capacity - size)
+        self._position_buffer[:size] = position_buffer
+        self._plot_offset[:size] = plot_offset
+        for k, event in enumerate(events):
+            event._index = k
+        self._head = 0
+        self._tail = size
+
+    def shift(self, delta):
+        """
+        Shift the events by delta seconds toward the start of the buffer.
+        """
+        self._position_buffer[self._head:self._tail] -= delta
+        for event in self:
+            event._update()
+
+    def clean_up(self):
+        """
+        Remove the events exiting the buffer.
+        """
+        head = bisect_left(self._position_buffer, 0, self._head, self._tail)
+        self._release(self._head, head)
+        self._head = head
+
+    def clear(self):
+        """
+        Remove all events.
+        """
+        self._release(self._head, self._tail)
+        self._head = 0
+        self._tail = 0
+
+    def _release(self, start, stop):
+        """
+        Remove the events between the slots start and stop. The events keep
+        their positions, since their slots are reused by other events.
+        """
+        for k in range(start, stop):
+            event = self._events[k]
+            event._position_buffer = float(self._position_buffer[k])
+            event._plot_offset = float(self._plot_offset[k])
+            event._buffer = None
+            event._index = None
+            self._events[k] = None
+
+    def __iter__(self):
+        return islice(self._events, self._head, self._tail)
+
+    @property
+    def position_buffer(self):
+        """
+        Positions in the buffer of the live events.
+        """
+        return self._position_buffer[self._head:self._tail]
+
+    @property
+    def position_plot(self):
+        """
+        Positions in the plotting window of the live events.
+        """
+        return self._position_buffer[self._head:self._tail] + \
+            self._plot_offset[self._head:self._tail]
+
+    def __len__(self):
+        return self._tail - self._head
+
+
 @fill_doc
 class _Event(ABC):
     """
@@ -196,6 +464,8 @@ class _Event(ABC):
     %(viewer_position_buffer)s
     %(viewer_position_plot)s
     """
+    __slots__ = ('_event_type', '_event_value', '_buffer', '_index',
+                 '_position_buffer', '_plot_offset')
     _supported = ['LPT']
 
     @abstractmethod
@@ -204,8 +474,19 @@ class _Event(ABC):
         assert event_type in self._supported
         self._event_type = event_type
         self._event_value = event_value
+        # Once added to an _EventBuffer, the positions are stored in the
+        # buffer's arrays at self._index.
+        self._buffer = None
+        self._index = None
         self._position_buffer = position_buffer  # In time (s)
-        self._position_plot = position_plot  # In time (s)
+        # position_plot = position_buffer + plot_offset
+        self._plot_offset = position_plot - position_buffer  # In time (s)
+
+    def _update(self):
+        """
+        Called when the positions are shifted by the _EventBuffer.
+        """
+        pass
 
     # ------------------------- Properties -------------------------
     @property
@@ -227,30 +508,40 @@ class _Event(ABC):
         """
         Position in the buffer.
         """
-        return self._position_buffer
+        if self._buffer is None:
+            return self._position_buffer
+        return self._buffer._position_buffer[self._index]
 
     @position_buffer.setter
     def position_buffer(self, position_buffer):
         """
         Update both position in the buffer and the plotting window.
         """
-        delta = self._position_buffer - position_buffer
-        self._position_buffer = position_buffer
-        self._position_plot -= delta
+        if self._buffer is None:
+            self._position_buffer = position_buffer
+        else:
+            self._buffer._position_buffer[self._index] = position_buffer
 
     @property
     def position_plot(self):
         """
         Position in the plotting window.
         """
-        return self._position_plot
+        if self._buffer is None:
+            return self._position_buffer + self._plot_offset
+        return self._buffer._position_buffer[self._index] + \
+            self._buffer._plot_offset[self._index]
 
     @position_plot.setter
     def position_plot(self, position_plot):
         """
         Update only the position in the plotting window.
         """
-        self._position_plot = position_plot
+        plot_offset = position_plot - self.position_buffer
+        if self._buffer is None:
+            self._plot_offset = plot_offset
+        else:
+            self._buffer._plot_offset[self._index] = plot_offset
 
 
 class _Annotation:
@@ -260,16 +551,17 @@ class _Annotation:
     Parameters
     ----------
     """
+    __slots__ = ('_description', '_duration', '_position_buffer',
+                 '_plot_offset', '_plotted')
 
-    @abstractmethod
     def __init__(self, description, duration, position_buffer, position_plot):
         self._description = description
         self._duration = duration
         self._position_buffer = position_buffer  # In time (s)
-        self._position_plot = position_plot  # In time (s)
+        # position_plot = position_buffer + plot_offset
+        self._plot_offset = position_plot - position_buffer  # In time (s)
         self._plotted = False
 
-    @abstractmethod
     def addAnnotationOnPlot(self):
         """
         Add annotation to the plot.
@@ -277,7 +569,6 @@ class _Annotation:
         if self._plotted:
             return  # skip, nothing to do
 
-    @abstractmethod
     def removeAnnotationFromPlot(self):
         """
         Remove annotation from the plot.
@@ -285,6 +576,12 @@ class _Annotation:
         if not self._plotted:
             return  # skip, nothing to do
 
+    def _exited_buffer(self):
+        """
+        True if the annotation exited the buffer.
+        """
+        return self._position_buffer < 0
+
     # ------------------------- Properties -------------------------
     @property
     def description(self):
@@ -312,23 +609,21 @@ class _Annotation:
         """
         Update both position in the buffer and the plotting window.
         """
-        delta = self._position_buffer - position_buffer
         self._position_buffer = position_buffer
-        self._position_plot -= delta
 
     @property
     def position_plot(self):
         """
         Position in the plotting window.
         """
-        return self._position_plot
+        return self._position_buffer + self._plot_offset
 
     @position_plot.setter
     def position_plot(self, position_plot):
         """
         Update only the position in the plotting window.
         """
-        self._position_plot = position_plot
+        self._plot_offset = position_plot - self._position_buffer
 
     @property
     def plotted(self):
@@ -1,14 +1,21 @@
 """
 PyQt5 Canvas for BSL's StreamViewer.
 """
+import time
+
 import numpy as np
 import pyqtgraph as pg
-from PyQt5.QtCore import QPointF, QTimer, QRectF
+from PyQt5.QtCore import Qt, QPointF, QTimer, QRectF
+from PyQt5.QtGui import QOpenGLContext
 
 from ._backend import _Backend, _Event, _Annotation
 from ...utils._docs import fill_doc, copy_doc
+from ...utils._imports import import_optional_dependency
+from ...utils._lttb import lttb
+from ...utils._numba_helpers import decode_triggers
+from ...utils._logs import logger
 
-# pg.setConfigOptions(antialias=True)
+numba = import_optional_dependency("numba", raise_error=False)
 
 
 @fill_doc
@@ -22,60 +29,97 @@ class _BackendPyQtGraph(_Backend):
     %(viewer_backend_geometry)s
     %(viewer_backend_xRange)s
     %(viewer_backend_yRange)s
+    useOpenGL : bool
+        If True, the canvas is rendered with OpenGL when an OpenGL context is
+        available, else with the software rasterizer. pyqtgraph's OpenGL
+        support is experimental, thus it is disabled by default.
     """
 
     # ---------------------------- Init ---------------------------
-    def __init__(self, scope, geometry, xRange, yRange):
+    def __init__(self, scope, geometry, xRange, yRange, useOpenGL=False):
         super().__init__(scope, geometry, xRange, yRange)
 
         # Variables
+        self._inv_sample_rate = 1. / self._scope.sample_rate
         self._available_colors = np.random.uniform(
-            size=(self._scope.nb_channels, 3), low=128, high=230)
+            size=(self._scope.nb_channels, 3), low=128, high=230).astype(
+                np.uint8)
+        self._pens = [pg.mkPen(pg.mkColor(*color))
+                      for color in self._available_colors.tolist()]
         self._init_variables()
 
         # Canvas
         self._win = pg.GraphicsLayoutWidget(
             size=geometry[2:],
             title=f'Stream Viewer: {self._scope.stream_name}')
+        if useOpenGL:
+            if QOpenGLContext().create():
+                self._win.useOpenGL(True)
+            else:
+                logger.info('OpenGL is not available. The Stream Viewer '
+                            'falls back to software rendering.')
         self._win.show()
         self._plot_handler = self._win.addPlot()  # pyqtgraph.PlotItem
-        subsampling_ratio = self._scope.sample_rate / 64
-        self._plot_handler.setDownsampling(ds=subsampling_ratio,
-                                           auto=None, mode='mean')
+        # signals are downsampled with LTTB in the update loop if it is
+        # compiled, else the python loops are too slow for the GUI thread
+        self._use_lttb = numba is not None
+        if self._use_lttb:
+            self._plot_handler.setDownsampling(auto=False)
+        else:
+            self._plot_handler.setDownsampling(auto=True, mode='peak')
+        self._plot_handler.setClipToView(True)
         self._plot_handler.setMouseEnabled(x=False, y=False)
         self._plot_handler.setMenuEnabled(False)
         self._init_canvas()
+        self._cache_view()
 
         # Plots
         self._plot_handler.clear()
         self._plots = dict()
+        self._plot_pool = dict()  # hidden PlotDataItems of unselected channels
         # Add PlotDataItem
         for k, idx in enumerate(self._scope.selected_channels):
             self._plots[idx] = self._plot_handler.plot(
                 x=self._x_arr,
                 y=self._scope.data_buffer[
                     idx, -self._duration_plot_samples:]+self._offset[k],
-                pen=pg.mkColor(self._available_colors[idx, :]))
+                pen=self._pens[idx])
+
+        # Trigger events lines, drawn for all events at once
+        self._LPT_trigger_lines = pg.PlotCurveItem(
+            pen=_TriggerEvent.colors['LPT'], connect='pairs')
+        self._LPT_trigger_lines_empty = True
+        self._plot_handler.addItem(self._LPT_trigger_lines)
 
         # Connect
         self._connect_signals_to_slots()
 
         # Annotations
         self._first_click_position = None
-        self._AnnotationThread.start()
 
         # Timer
         self._timer = QTimer(self._win)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setSingleShot(True)  # re-armed by the update loop
         self._timer.timeout.connect(self._update_loop)
 
     @copy_doc(_Backend._init_variables)
     def _init_variables(self):
         super()._init_variables()
 
+        # selected_channels
+        self._selected_channels_idx = np.array(self._selected_channels,
+                                               dtype=int)
+
         # yRange
-        self._offset = np.arange(
-            0, -len(self._scope.selected_channels)*self._yRange,
-            -self._yRange)
+        self._offset = -np.arange(
+            len(self._selected_channels), dtype=np.float32) \
+            * np.float32(self._yRange)
+
+        # Displayed signals, re-used at every update
+        self._display_buffer = np.empty(
+            (len(self._selected_channels), self._duration_plot_samples),
+            dtype=self._scope.data_buffer.dtype)
 
     def _init_canvas(self):
         """
@@ -85,23 +129,27 @@ class _BackendPyQtGraph(_Backend):
         self._plot_handler.disableAutoRange()
         yRange = [
             1.5*self._yRange,
-            -self._yRange*(len(self._scope.selected_channels)+1)]
+            -self._yRange*(len(self._selected_channels)+1)]
         self._plot_handler.setRange(
             xRange=[0, self._xRange],
             yRange=yRange)
         self._plot_handler.showGrid(y=True)
+        self._LPT_trigger_lines_y = np.array(yRange)
 
         # Y-axis
-        yticks = [(-k*self._yRange, self._scope.channels_labels[idx])
-                  for k, idx in enumerate(self._scope.selected_channels)]
+        yticks = list(zip(
+            self._offset.tolist(),
+            [self._scope.channels_labels[idx]
+             for idx in self._selected_channels]))
         ticks = [yticks, []]  # [major, minor]
         self._plot_handler.getAxis('left').setTicks(ticks)
         self._plot_handler.setLabel(
             axis='left', text=f'Scale (uV): {self._yRange}')
 
         # X-axis
-        self._x_arr = np.arange(self._duration_plot_samples) \
-            / self._scope.sample_rate
+        self._x_arr = np.arange(self._duration_plot_samples,
+                                dtype=np.float32) \
+            / np.float32(self._scope.sample_rate)
         self._plot_handler.setLabel(axis='bottom', text='Time (s)')
 
     # -------------------------- Main Loop -------------------------
@@ -111,36 +159,78 @@ class _BackendPyQtGraph(_Backend):
 
     @copy_doc(_Backend._update_loop)
     def _update_loop(self):
-        super()._update_loop()
-
-        if len(self._scope.ts_list) > 0:
-            for k, idx in enumerate(self._scope.selected_channels):
-                self._plots[idx].setData(
-                    x=self._x_arr,
-                    y=self._scope.data_buffer[
-                        idx, -self._duration_plot_samples:] + self._offset[k])
-
-            # Update existing events position
-            for event in self._trigger_events:
-                event.position_buffer = event.position_buffer \
-                    - len(self._scope.ts_list) / self._scope.sample_rate
-            # Add new events entering the buffer
-            self._update_LPT_trigger_events(
-                self._scope.trigger_buffer[-len(self._scope.ts_list):])
-            # Hide/Remove events exiting window and buffer
-            self._clean_up_trigger_events()
-
-            for annot in self._annotations:
-                annot.position_buffer = QPointF(
-                    annot.position_buffer.x()
-                        - len(self._scope.ts_list) / self._scope.sample_rate,
-                        0)
-            if self._first_click_position is not None:
-                position = self._first_click_position.x() - len(self._scope.ts_list) / self._scope.sample_rate
-                self._first_click_position.setX(position)
-                self._lineItem.setValue(position)
-
-            self._clean_up_annotations()
+        start = time.perf_counter()
+        n_new = 0
+        try:
+            super()._update_loop()
+            n_new = len(self._scope.ts_list)
+            if n_new != 0:
+                self._update_canvas(n_new)
+        finally:
+            # the timer is single-shot, re-arm it even if the update failed
+            if n_new == 0:
+                # no new samples, poll the scope less often
+                self._timer.start(40)
+            else:
+                # keep a 20 ms period, including the time spent here
+                elapsed = int((time.perf_counter() - start) * 1000)
+                self._timer.start(max(5, 20 - elapsed))
+
+    def _update_canvas(self, n_new):
+        """
+        Update the plots, trigger events and annotations with the n_new
+        samples which entered the scope's buffer.
+        """
+        scope = self._scope
+        delta = n_new * self._inv_sample_rate
+        self._cache_view()
+        # x is passed along since pyqtgraph resets it to np.arange(N)
+        # when only y is provided.
+        x_arr = self._x_arr
+        data = self._display_buffer
+        plots = self._plots
+        selected_channels = self._selected_channels
+        np.take(scope.data_buffer[:, -self._duration_plot_samples:],
+                self._selected_channels_idx, axis=0, out=data)
+        np.add(data, self._offset[:, np.newaxis], out=data)
+        # downsample to about one sample per pixel
+        n_out = int(self._view_width)
+        if self._use_lttb and 3 <= n_out < data.shape[1]:
+            xs, ys = lttb(x_arr, data, n_out)
+            for idx, x, y in zip(selected_channels, xs, ys):
+                plots[idx].setData(x=x, y=y)
+        else:
+            for idx, y in zip(selected_channels, data):
+                plots[idx].setData(x=x_arr, y=y)
+
+        # Update existing events position
+        self._shift_trigger_events(delta)
+        # Add new events entering the buffer
+        self._update_LPT_trigger_events(scope.trigger_buffer[-n_new:])
+        # Hide/Remove events exiting window and buffer
+        self._clean_up_trigger_events()
+        self._update_LPT_trigger_lines()
+
+        for annot in self._annotations:
+            annot._shift(delta, self._view_transform)
+        if self._first_click_position is not None:
+            position = self._first_click_position.x() - delta
+            self._first_click_position.setX(position)
+            self._lineItem.setValue(position)
+
+        self._clean_up_annotations()
+
+    def _cache_view(self):
+        """
+        Retrieve the size of the view box and its view to scene transform,
+        shared by all the items updated in a frame.
+        """
+        viewBox = self._plot_handler.getViewBox()
+        self._view_width = viewBox.width()
+        self._view_height = viewBox.height()
+        # childTransform() first brings the view range up to date
+        self._view_transform = \
+            viewBox.childTransform() * viewBox.sceneTransform()
 
     # -------------------------- Annotations -----------------------
     @copy_doc(_Backend._clean_up_annotations)
@@ -149,35 +239,44 @@ class _BackendPyQtGraph(_Backend):
          Hide annotations exiting the plotting window.
         """
         super()._clean_up_annotations()
+        if len(self._annotations) == 0:
+            return
         for annot in self._annotations:
-            if annot.position_plot < 0:
-                annot.removeAnnotationFromPlot()
+            if annot.position_plot.x() < 0:
+                annot.remove()
 
     # ------------------------ Trigger Events ----------------------
     @copy_doc(_Backend._update_LPT_trigger_events)
     def _update_LPT_trigger_events(self, trigger_arr):
-        events_trigger_arr_idx = np.where(trigger_arr != 0)[0]
-        events_values = trigger_arr[events_trigger_arr_idx]
+        # events are not tracked while hidden, the show_LPT_trigger_events
+        # setter retrieves them from the whole buffer
+        if not self._show_LPT_trigger_events:
+            return
+        # trigger values are integer codes, stored as float by the scope
+        trigger_arr = np.ascontiguousarray(trigger_arr, dtype=np.int32)
+        events_values, positions_buffer, positions_plot = decode_triggers(
+            trigger_arr, self._scope.duration_buffer, self._inv_sample_rate,
+            self._delta_with_buffer)
+        if events_values.size == 0:
+            return
 
+        events = list()
         for k, event_value in enumerate(events_values):
-            position_buffer = self._scope.duration_buffer - \
-                (trigger_arr.shape[0] - events_trigger_arr_idx[k]) \
-                / self._scope.sample_rate
-            position_plot = position_buffer - self._delta_with_buffer
-
+            position_plot = positions_plot[k]
             event = _TriggerEvent(
                 event_type='LPT',
                 event_value=event_value,
-                position_buffer=position_buffer,
+                position_buffer=positions_buffer[k],
                 position_plot=position_plot,
                 plot_handler=self._plot_handler,
                 yRange=self._yRange)
 
             if position_plot >= 0:
-                if event.event_type == 'LPT' and self._show_LPT_trigger_events:
-                    event.addEventPlot()
+                event.addEventPlot()
 
-            self._trigger_events.append(event)
+            events.append(event)
+
+        self._add_trigger_events(events)
 
     @copy_doc(_Backend._clean_up_trigger_events)
     def _clean_up_trigger_events(self):
@@ -185,14 +284,34 @@ class _BackendPyQtGraph(_Backend):
          Hide events exiting the plotting window.
         """
         super()._clean_up_trigger_events()
+        if len(self._trigger_events) == 0:
+            return
         for event in self._trigger_events:
             if event.position_plot < 0:
                 event.removeEventPlot()
 
+    def _update_LPT_trigger_lines(self):
+        """
+        Draw the lines of all the displayed LPT trigger events in one call.
+        """
+        if self._show_LPT_trigger_events:
+            positions = self._trigger_events.position_plot
+            positions = positions[0 <= positions]
+        else:
+            positions = np.empty(0)
+        # skip the redraw if there was and there is still nothing to draw
+        if positions.size == 0 and self._LPT_trigger_lines_empty:
+            return
+        self._LPT_trigger_lines_empty = positions.size == 0
+        self._LPT_trigger_lines.setData(
+            x=np.repeat(positions, 2),
+            y=np.tile(self._LPT_trigger_lines_y, positions.size))
+
     # --------------------------- Events ---------------------------
     @copy_doc(_Backend.close)
     def close(self):
         self._timer.stop()
+        super().close()
         self._win.close()
 
     def _connect_signals_to_slots(self):
@@ -232,11 +351,11 @@ class _BackendPyQtGraph(_Backend):
                 viewBox=viewBox)
 
             onset = int(position_buffer.x() * self._scope.sample_rate)
-            self._queueTimeStamps.put([self._scope._timestamps_buffer[onset],
-                                       duration, self._label])
+            self._queue_annotation(self._scope._timestamps_buffer[onset],
+                                   duration.x(), self._label)
 
             self._plot_handler.removeItem(self._lineItem)
-            annotation.add()
+            annotation.add(self._view_transform, self._view_height)
             self._annotations.append(annotation)
             self._first_click_position = None
 
@@ -247,6 +366,7 @@ class _BackendPyQtGraph(_Backend):
         self._xRange = xRange
         self._init_variables()
         self._init_canvas()
+        self._cache_view()
 
         for event in self._trigger_events:
             event.position_plot = event.position_buffer-self._delta_with_buffer
@@ -255,11 +375,12 @@ class _BackendPyQtGraph(_Backend):
                     event.addEventPlot()
             else:
                 event.removeEventPlot()
+        self._update_LPT_trigger_lines()
 
         for annot in self._annotations:
             annot.position_plot.setX(annot.position_buffer.x() - self._delta_with_buffer)
             if annot.position_plot.x() >= 0:
-                annot.add()
+                annot.add(self._view_transform, self._view_height)
             else:
                 annot.remove()
 
@@ -272,44 +393,60 @@ class _BackendPyQtGraph(_Backend):
 
         for event in self._trigger_events:
             event.yRange = self._yRange
+        self._update_LPT_trigger_lines()
 
     @_Backend.selected_channels.setter
     @copy_doc(_Backend.selected_channels.setter)
     def selected_channels(self, selected_channels):
-        plots2remove = [idx for idx in self._selected_channels
-                        if idx not in selected_channels]
-        plots2add = [idx for idx in selected_channels
-                     if idx not in self._selected_channels]
+        previous = frozenset(self._selected_channels)
+        plots2remove = previous.difference(selected_channels)
+        plots2add = [idx for idx in selected_channels if idx not in previous]
         self._selected_channels = selected_channels
         self._init_variables()
         self._init_canvas()
+        self._update_LPT_trigger_lines()
 
+        # PlotDataItems are hidden and kept to be reused if the channel is
+        # selected again, instead of being removed from the scene.
         for idx in plots2remove:
-            self._plot_handler.removeItem(self._plots[idx])
-            del self._plots[idx]
+            plot = self._plots.pop(idx)
+            plot.setVisible(False)
+            self._plot_pool[idx] = plot
         for k, idx in enumerate(plots2add):
-            self._plots[idx] = self._plot_handler.plot(
-                x=self._x_arr,
-                y=self._scope.data_buffer[
-                    idx, -self._duration_plot_samples:] + self._offset[k],
-                pen=pg.mkColor(self._available_colors[idx, :]))
+            y = self._scope.data_buffer[
+                idx, -self._duration_plot_samples:] + self._offset[k]
+            if idx in self._plot_pool:
+                plot = self._plot_pool.pop(idx)
+                plot.setData(x=self._x_arr, y=y)
+                plot.setVisible(True)
+                self._plots[idx] = plot
+            else:
+                self._plots[idx] = self._plot_handler.plot(
+                    x=self._x_arr, y=y, pen=self._pens[idx])
 
     @_Backend.show_LPT_trigger_events.setter
     @copy_doc(_Backend.show_LPT_trigger_events.setter)
     def show_LPT_trigger_events(self, show_LPT_trigger_events):
         self._show_LPT_trigger_events = show_LPT_trigger_events
+        if self._show_LPT_trigger_events:
+            # events are not kept while hidden, retrieve the ones in buffer
+            self._trigger_events.clear()
+            self._update_LPT_trigger_events(self._scope.trigger_buffer)
         for event in self._trigger_events:
             if event.position_plot >= 0 and event.event_type == 'LPT':
                 if self._show_LPT_trigger_events:
                     event.addEventPlot()
                 else:
                     event.removeEventPlot()
+        self._update_LPT_trigger_lines()
 
 
 @fill_doc
 class _TriggerEvent(_Event):
     """
-    Class defining a trigger event for the pyqtgraph backend.
+    Class defining a trigger event for the pyqtgraph backend. The event
+    displays its value, while the lines of all events are drawn at once by the
+    backend.
 
     Parameters
     ----------
@@ -322,6 +459,7 @@ class _TriggerEvent(_Event):
     yRange : int | float
         Currently set signal range/scale.
     """
+    __slots__ = ('_plot_handler', '_yRange', '_textItem', '_plotted')
     colors = {'LPT': pg.mkColor(0, 255, 0)}
 
     def __init__(self, event_type, event_value, position_buffer, position_plot,
@@ -331,35 +469,28 @@ class _TriggerEvent(_Event):
         self._plot_handler = plot_handler
         self._yRange = yRange
 
-        self._lineItem = None
         self._textItem = None
         self._plotted = False
 
     def addEventPlot(self):
         """
-        Plots the event on the handler.
+        Plots the event value on the handler.
         """
         if not self._plotted:
-            self._lineItem = pg.InfiniteLine(
-                pos=self._position_plot, pen=self.colors[self._event_type])
-            self._plot_handler.addItem(self._lineItem)
-
             self._textItem = pg.TextItem(str(self._event_value),
                                          anchor=(0.5, 0.5),
                                          fill=(0, 0, 0),
                                          color=self.colors[self._event_type])
-            self._textItem.setPos(self._position_plot, 1.5*self._yRange)
+            self._textItem.setPos(self.position_plot, 1.5*self._yRange)
             self._plot_handler.addItem(self._textItem)
             self._plotted = True
 
     def removeEventPlot(self):
         """
-        Remove the event from the plot handler.
+        Remove the event value from the plot handler.
         """
         if self._plotted:
-            self._plot_handler.removeItem(self._lineItem)
             self._plot_handler.removeItem(self._textItem)
-            self._lineItem = None
             self._textItem = None
             self._plotted = False
 
@@ -367,10 +498,8 @@ class _TriggerEvent(_Event):
         """
         Updates the plot handler.
         """
-        if self._lineItem is not None:
-            self._lineItem.setValue(self._position_plot)
         if self._textItem is not None:
-            self._textItem.setPos(self._position_plot, 1.5*self._yRange)
+            self._textItem.setPos(self.position_plot, 1.5*self._yRange)
 
     def __del__(self):
         try:
@@ -437,6 +566,7 @@ class Annot(_Annotation):
     Parameters
     ----------
     """
+    __slots__ = ('_plot_handler', '_rectangle')
     pen = pg.mkColor(0, 255, 255)
     brush = pg.mkBrush(0, 255, 255, 50)
 
@@ -447,14 +577,15 @@ class Annot(_Annotation):
         self._rectangle = None
 
     @copy_doc(_Annotation.addAnnotationOnPlot)
-    def addAnnotationOnPlot(self):
+    def addAnnotationOnPlot(self, height=None):
         super().addAnnotationOnPlot()
         # retrieve position of edges (seconds)
-        position_left_edge = self._position_plot - self._duration
-        position_right_edge = self._position_plot
+        position_left_edge = self.position_plot - self._duration
+        position_right_edge = self.position_plot
 
         # retrieve height
-        height = self._plot_handler.getViewBox().height()
+        if height is None:
+            height = self._plot_handler.getViewBox().height()
 
         # create rectangle
         rectangle = QRectF(
@@ -484,7 +615,7 @@ class Annot(_Annotation):
 
         # retrieve rectangle
         rectangle = self._rectangle.rect()
-        position_left_edge = self._position_plot - self._duration
+        position_left_edge = self.position_plot - self._duration
 
         # clip with Y-axis
         if position_left_edge <= 0:
@@ -494,7 +625,7 @@ class Annot(_Annotation):
         # move left on the plot
         else:
             x1 = self._plot_handler.getViewBox().mapViewToScene(
-                QPointF(self._position_plot, 0)).x() - rectangle.width()
+                QPointF(self.position_plot, 0)).x() - rectangle.width()
             rectangle.moveTo(x1, 0)
 
         # set rectangle
@@ -545,7 +676,7 @@ class Annotation:
         self._rect = None
         self._plotted = False
 
-    def add(self):
+    def add(self, transform=None, height=None):
         try:
             pen = self.pens[self._annotation_description]
             brush = self.brushs[self._annotation_description]
@@ -554,14 +685,17 @@ class Annotation:
             brush = pg.mkBrush(255, 0, 0, 50)
 
         if not self._plotted:
-            position_left = self._viewBox.mapViewToScene(
+            if transform is None:
+                transform = self._view_transform()
+            if height is None:
+                height = self._viewBox.height()
+            position_left = transform.map(
                 self._position_plot - self._duration).x()
-            position_right = self._viewBox.mapViewToScene(
-                self._position_plot).x()
+            position_right = transform.map(self._position_plot).x()
 
             rectangle = QRectF(
                 QPointF(position_left, 0),
-                QPointF(position_right, self._viewBox.height()))
+                QPointF(position_right, height))
             self._rect = self._plot_handler.getViewBox().scene().addRect(
                 rectangle, pen, brush)
             self._plotted=True
@@ -572,16 +706,18 @@ class Annotation:
             self._rect = None
             self._plotted = False
 
-    def _update(self):
+    def _update(self, transform=None):
         if self._rect is not None:
-            borderR_pos = self._viewBox.mapViewToScene(self._position_plot).x()
-            borderL_pos = borderR_pos - self._rect.rect().width()
-            borderL_time = self._viewBox.mapSceneToView(
-                QPointF(borderL_pos, 0)).x()
-
+            if transform is None:
+                transform = self._view_transform()
             rect = self._rect.rect()
+            borderR_pos = transform.map(self._position_plot).x()
+            borderL_pos = borderR_pos - rect.width()
+            # the view is not rotated, scene x = m11 * view x + dx
+            borderL_time = (borderL_pos - transform.dx()) / transform.m11()
+
             if borderL_time <= 0:
-                x1 = self._viewBox.mapViewToScene(QPointF(0, 0)).x()
+                x1 = transform.dx()
                 y1 = 0
                 x2 = borderR_pos
                 y2 = rect.height()
@@ -590,6 +726,27 @@ class Annotation:
                 rect.moveTo(borderL_pos, 0)
             self._rect.setRect(rect)
 
+    def _exited_buffer(self):
+        """
+        True if the annotation exited the buffer.
+        """
+        return self._position_buffer.x() < 0
+
+    def _view_transform(self):
+        """
+        View to scene transform of the view box.
+        """
+        return self._viewBox.childTransform() * self._viewBox.sceneTransform()
+
+    def _shift(self, delta, transform=None):
+        """
+        Shift the annotation by delta in the buffer and the plotting window.
+        The view to scene transform can be provided to avoid retrieving it.
+        """
+        self._position_buffer.setX(self._position_buffer.x() - delta)
+        self._position_plot.setX(self._position_plot.x() - delta)
+        self._update(transform)
+
     @property
     def position_buffer(self):
         return self._position_buffer
@@ -0,0 +1,233 @@
+import threading
+
+import numpy as np
+
+from bsl.stream_viewer.backends._backend import (_Backend, _Event,
+                                                 _EventBuffer, _SPSCRing)
+
+
+class _MockScope:
+    """Scope without data."""
+
+    def __init__(self):
+        self.selected_channels = [0, 1]
+
+    def update_loop(self):
+        pass
+
+
+class _MockBackend(_Backend):
+    """Backend without display."""
+
+    def __init__(self):
+        super().__init__(_MockScope(), None, 10, 25)
+
+    def start_timer(self):
+        pass
+
+    def _update_loop(self):
+        super()._update_loop()
+
+    def _update_LPT_trigger_events(self, trigger_arr):
+        pass
+
+    def close(self):
+        super().close()
+
+    xRange = property(_Backend.xRange.fget)
+    yRange = property(_Backend.yRange.fget)
+    selected_channels = property(_Backend.selected_channels.fget)
+    show_LPT_trigger_events = property(
+        _Backend.show_LPT_trigger_events.fget)
+
+
+class _MockEvent(_Event):
+    """Event without display."""
+    __slots__ = ()
+
+    def __init__(self, event_value, position_buffer, position_plot):
+        super().__init__('LPT', event_value, position_buffer, position_plot)
+
+
+def _events(positions, delta=20):
+    """Create events at the given positions in the buffer."""
+    return [_MockEvent(k, position, position - delta)
+            for k, position in enumerate(positions)]
+
+
+def test_event_buffer():
+    """Test the buffer of trigger events."""
+    buffer = _EventBuffer(capacity=4)
+    events = _events([1., 2., 3.])
+    buffer.extend(events)
+    assert len(buffer) == 3
+    assert list(buffer) == events
+    assert np.allclose(buffer.position_buffer, [1., 2., 3.])
+    assert np.allclose(buffer.position_plot, [-19., -18., -17.])
+
+    # shift and remove the events exiting the buffer
+    buffer.shift(1.5)
+    assert np.allclose([event.position_buffer for event in events],
+                       [-0.5, 0.5, 1.5])
+    buffer.clean_up()
+    assert list(buffer) == events[1:]
+
+    # move the live events to the front, then grow
+    new_events = _events([4., 5., 6.])
+    buffer.extend(new_events)
+    assert len(buffer) == 5
+    assert list(buffer) == events[1:] + new_events
+    assert np.allclose(buffer.position_buffer, [0.5, 1.5, 4., 5., 6.])
+    assert np.allclose([event.position_plot for event in buffer],
+                       [-19.5, -18.5, -16., -15., -14.])
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert list(buffer) == []
+
+
+def test_event_buffer_removed_events():
+    """Test that removed events keep their positions."""
+    buffer = _EventBuffer(capacity=2)
+    events = _events([1., 2.])
+    buffer.extend(events)
+    buffer.shift(1.5)
+    buffer.clean_up()
+    removed = events[0]
+    assert removed._buffer is None
+    assert removed.position_buffer == -0.5
+    assert removed.position_plot == -20.5
+
+    # the slot of the removed event is reused
+    buffer.extend(_events([7., 8.]))
+    assert removed.position_buffer == -0.5
+    assert removed.position_plot == -20.5
+
+    buffer.clear()
+    assert all(event._buffer is None for event in events)
+    assert events[1].position_buffer == 0.5
+    assert events[1].position_plot == -19.5
+
+
+class _FailingFile:
+    """File raising on write."""
+
+    def write(self, text):
+        raise OSError('No space left on device')
+
+
+class _BlockingFile:
+    """File blocking on write until released."""
+
+    def __init__(self):
+        self.released = threading.Event()
+
+    def write(self, text):
+        self.released.wait()
+
+    def flush(self):
+        pass
+
+
+def test_annotation_writer_errors(caplog):
+    """Test that the errors raised by the annotation writer are logged."""
+    backend = _MockBackend()
+    backend._recorder_annotation_file = _FailingFile()
+    backend._queue_annotation(1., 0.5, 'bad')
+    backend._update_loop()
+    backend._AnnotationExecutor.shutdown(wait=True)
+    assert 'Annotations could not be saved' in caplog.text
+    assert 'No space left on device' in caplog.text
+
+
+def test_flush_annotations_timeout(caplog):
+    """Test that a writer not finishing within the timeout is reported."""
+    backend = _MockBackend()
+    file = _BlockingFile()
+    backend._recorder_annotation_file = file
+    backend._queue_annotation(1., 0.5, 'bad')
+    try:
+        assert not backend._flush_annotations(timeout=0.05)
+        assert 'still being saved after 0.05 seconds' in caplog.text
+    finally:
+        file.released.set()
+    assert backend._flush_annotations(timeout=1)
+    backend._AnnotationExecutor.shutdown(wait=True)
+
+
+def test_close_with_stalled_writer(caplog):
+    """Test that closing does not block on a stalled annotation writer."""
+    backend = _MockBackend()
+    file = _BlockingFile()
+    backend._recorder_annotation_file = file
+    backend._queue_annotation(1., 0.5, 'bad')
+    backend._update_loop()  # the writer stalls on this annotation
+    try:
+        backend._queue_annotation(2., 0.5, 'bad_muscle')
+        backend.close()
+        assert 'still being saved after 1 seconds' in caplog.text
+        assert "Annotation 'bad_muscle' at 2.000 was not saved" in caplog.text
+        assert "Annotation 'bad' " not in caplog.text
+    finally:
+        file.released.set()
+
+
+def test_spsc_ring():
+    """Test the ring buffer of annotations to save."""
+    ring = _SPSCRing(size=4)
+    assert ring.empty()
+    assert ring.get_all() == []
+
+    # wrap around the end of the ring
+    for k in range(3):
+        assert ring.put(k)
+    assert ring.get_all() == [0, 1, 2]
+    for k in range(3, 6):
+        assert ring.put(k)
+    assert not ring.empty()
+    assert ring.get_all() == [3, 4, 5]
+    assert ring.empty()
+
+    # full with size pending items
+    for k in range(4):
+        assert ring.put(k)
+    assert not ring.put(4)
+    assert ring.get_all() == [0, 1, 2, 3]
+    assert ring.put(4)
+    assert ring.get_all() == [4]
+
+
+def test_queue_annotation_full(caplog):
+    """Test that annotations are dropped when the queue is full."""
+    backend = _MockBackend()
+    backend._AnnotationQueue = _SPSCRing(size=2)
+    backend._queue_annotation(1., 0.5, 'bad')
+    backend._queue_annotation(2., 0.5, 'bad')
+    assert 'queue is full' not in caplog.text
+    backend._queue_annotation(3., 0.5, 'bad_muscle')
+    assert "The annotation 'bad_muscle' at 3.000 is dropped" in caplog.text
+    assert backend._AnnotationQueue.get_all() == [(1., 0.5, 'bad'),
+                                                  (2., 0.5, 'bad')]
+    backend.close()
+
+
+def test_write_annotation_to_disk(tmp_path):
+    """Test the text written by the annotation writer."""
+    backend = _MockBackend()
+    fname = tmp_path / 'annotations.txt'
+
+    # not recording
+    backend._queue_annotation(0.5, 0.25, 'bad')
+    backend._write_annotation_to_disk()
+    assert backend._AnnotationQueue.empty()
+
+    with open(fname, 'w') as file:
+        backend._recorder_annotation_file = file
+        backend._queue_annotation(1., 0.5, 'bad')
+        backend._queue_annotation(1234.5678901, 2, 'bad_muscle')
+        backend._write_annotation_to_disk()
+        backend._recorder_annotation_file = None
+    with open(fname, 'r') as file:
+        assert file.read() == ('1.000000 0.500000 bad\n'
+                               '1234.567890 2.000000 bad_muscle\n')
+    backend.close()
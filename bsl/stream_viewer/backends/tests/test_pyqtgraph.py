@@ -0,0 +1,134 @@
+import os
+from unittest import mock
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QPointF  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from bsl.stream_viewer.backends.pyqtgraph import (  # noqa: E402
+    _BackendPyQtGraph, Annotation)
+from bsl.stream_viewer.control_gui.control_eeg import (  # noqa: E402
+    ControlGUI_EEG)
+
+
+class _MockScope:
+    """Scope streaming random data, 10 samples per update."""
+
+    def __init__(self, nb_channels=4, sample_rate=512, duration_buffer=30):
+        self.nb_channels = nb_channels
+        self.sample_rate = sample_rate
+        self.duration_buffer = duration_buffer
+        self.duration_buffer_samples = duration_buffer * sample_rate
+        self.selected_channels = list(range(nb_channels))
+        self.channels_labels = [f'CH{k}' for k in range(nb_channels)]
+        self.stream_name = 'mock'
+        self.data_buffer = np.zeros(
+            (nb_channels, self.duration_buffer_samples), dtype=np.float32)
+        self.trigger_buffer = np.zeros(self.duration_buffer_samples)
+        self._timestamps_buffer = np.zeros(self.duration_buffer_samples)
+        self.ts_list = list()
+        self.apply_car = False
+        self.apply_bandpass = False
+
+    def init_bandpass_filter(self, low, high):
+        pass
+
+    def update_loop(self):
+        n = 10
+        self.ts_list = list(range(n))
+        self.data_buffer = np.roll(self.data_buffer, -n, axis=1)
+        self.data_buffer[:, -n:] = np.random.randn(self.nb_channels, n)
+        self.trigger_buffer = np.roll(self.trigger_buffer, -n)
+        self.trigger_buffer[-n:] = 0
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Qt application required by the widgets."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def backend(app):
+    """PyQtGraph backend connected to a mock scope."""
+    backend = _BackendPyQtGraph(_MockScope(), (0, 0, 800, 600), 10, 25)
+    yield backend
+    backend.close()
+
+
+def test_annotations_exiting_buffer(backend):
+    """Test that annotations are shifted, hidden and removed."""
+    delta = backend._delta_with_buffer
+    position_plot = QPointF(0.05, 0)
+    position_buffer = QPointF(position_plot.x() + delta, 0)
+    annotation = Annotation(
+        backend._plot_handler, position_buffer=position_buffer,
+        position_plot=position_plot, duration=QPointF(0.02, 0),
+        annotation_description='bad',
+        viewBox=backend._plot_handler.getViewBox())
+    annotation.add()
+    backend._annotations.append(annotation)
+
+    # exits the plotting window, but is still in the buffer
+    for _ in range(10):
+        backend._update_loop()
+    assert backend._annotations == [annotation]
+    assert annotation.position_plot.x() < 0
+    assert not annotation._plotted
+
+    # exits the buffer
+    n_updates = int(np.ceil(delta * backend.scope.sample_rate / 10))
+    for _ in range(n_updates):
+        backend._update_loop()
+    assert annotation.position_buffer.x() < 0
+    assert len(backend._annotations) == 0
+
+
+def test_timer_rearmed_on_error(backend):
+    """Test that the single-shot timer is re-armed if an update fails."""
+    def _raise(n_new):
+        raise RuntimeError('update failed')
+
+    backend._update_canvas = _raise
+    backend._timer.stop()
+    with pytest.raises(RuntimeError, match='update failed'):
+        backend._update_loop()
+    assert backend._timer.isActive()
+
+
+def test_LPT_trigger_events(backend):
+    """Test that trigger events are only tracked while displayed."""
+    scope = backend.scope
+    scope.trigger_buffer[-5] = 3
+    backend._update_LPT_trigger_events(scope.trigger_buffer[-10:])
+    assert len(backend._trigger_events) == 0
+
+    backend.show_LPT_trigger_events = True
+    assert len(backend._trigger_events) == 1
+    event = next(iter(backend._trigger_events))
+    assert event.event_value == 3
+    assert event.plotted
+    backend._update_LPT_trigger_events(np.array([0, 0, 4, 0]))
+    assert len(backend._trigger_events) == 2
+
+    backend.show_LPT_trigger_events = False
+    backend._update_loop()
+    assert len(backend._trigger_events) == 0
+
+
+@pytest.mark.parametrize('useOpenGL', (False, True))
+def test_useOpenGL(app, useOpenGL):
+    """Test that useOpenGL is passed from the controller to the backend."""
+    init = _BackendPyQtGraph.__init__
+    with mock.patch.object(_BackendPyQtGraph, '__init__', autospec=True,
+                           side_effect=init) as mock_init:
+        gui = ControlGUI_EEG(_MockScope(), 'pyqtgraph', useOpenGL)
+    try:
+        assert mock_init.call_args.kwargs['useOpenGL'] is useOpenGL
+    finally:
+        gui.backend.close()
+        gui.close()
@@ -8,6 +8,7 @@ import numpy as np
 from ._backend import _Backend, _Event
 from ...utils._docs import fill_doc, copy_doc
 from ...utils._imports import import_optional_dependency
+from ...utils._numba_helpers import decode_triggers
 
 vispy = import_optional_dependency(
     "vispy", extra="Install Vispy for backend support.")
@@ -77,7 +78,6 @@ class _BackendVispy(_Backend, vispy.app.Canvas):
     # ---------------------------- Init ---------------------------
     def __init__(self, scope, geometry, xRange, yRange):
         super().__init__(scope, geometry, xRange, yRange)
-        self._trigger_events = list()
 
         # Variables
         self._available_colors = np.random.uniform(
@@ -192,22 +192,21 @@ class _BackendVispy(_Backend, vispy.app.Canvas):
     # ------------------------ Trigger Events ----------------------
     @copy_doc(_Backend._update_LPT_trigger_events)
     def _update_LPT_trigger_events(self, trigger_arr):
-        events_trigger_arr_idx = np.where(trigger_arr != 0)[0]
-        events_values = trigger_arr[events_trigger_arr_idx]
+        events_values, positions_buffer, positions_plot = decode_triggers(
+            trigger_arr, self._scope.duration_buffer,
+            1. / self._scope.sample_rate, self._delta_with_buffer)
 
+        events = list()
         for k, event_value in enumerate(events_values):
-            position_buffer = self._scope.duration_buffer - \
-                (trigger_arr.shape[0] - events_trigger_arr_idx[k]) \
-                / self._scope.sample_rate
-            position_plot = position_buffer - self._delta_with_buffer
-
             event = _TriggerEvent(
                 event_type='LPT',
                 event_value=event_value,
-                position_buffer=position_buffer,
-                position_plot=position_plot)
+                position_buffer=positions_buffer[k],
+                position_plot=positions_plot[k])
+
+            events.append(event)
 
-            self._trigger_events.append(event)
+        self._add_trigger_events(events)
 
     # -------------------------- Main Loop -------------------------
     @copy_doc(_Backend.start_timer)
@@ -226,9 +225,8 @@ class _BackendVispy(_Backend, vispy.app.Canvas):
                         np.float32, copy=False))
 
             # Update existing events position
-            for event in self._trigger_events:
-                event.position_buffer = event.position_buffer \
-                    - len(self._scope.ts_list) / self._scope.sample_rate
+            self._shift_trigger_events(
+                len(self._scope.ts_list) / self._scope.sample_rate)
             # Add new events entering the buffer
             self._update_LPT_trigger_events(
                 self._scope.trigger_buffer[-len(self._scope.ts_list):])
@@ -251,6 +249,7 @@ class _BackendVispy(_Backend, vispy.app.Canvas):
     @copy_doc(_Backend.close)
     def close(self):
         self._timer.stop()
+        super().close()
         vispy.app.Canvas.close(self)
 
     # ------------------------ Update program ----------------------
@@ -313,6 +312,7 @@ class _TriggerEvent(_Event):
     %(viewer_position_buffer)s
     %(viewer_position_plot)s
     """
+    __slots__ = ()
     colors = {'LPT': np.array([0., 1.0, 0.], dtype=np.float32)}
 
     def __init__(self, event_type, event_value,
@@ -29,12 +29,14 @@ class _ControlGUI(QMainWindow, ABC, metaclass=_metaclass_ControlGUI):
     ----------
     %(viewer_scope)s
     %(viewer_backend)s
+    %(viewer_useOpenGL)s
     """
 
     @abstractmethod
-    def __init__(self, scope, backend):
+    def __init__(self, scope, backend, useOpenGL=False):
         super().__init__()
         self._scope = scope
+        self._useOpenGL = useOpenGL
 
     @abstractmethod
     def _load_gui(self):
@@ -90,8 +92,7 @@ class _ControlGUI(QMainWindow, ABC, metaclass=_metaclass_ControlGUI):
     @QtCore.pyqtSlot()
     def onClicked_pushButton_stop_recording(self):
         if self._recorder.state.value == 1:
-            self._backend._AnnotationQueue.join(0.5)
-            self._backend._AnnotationThread.join(0.2)
+            self._backend._flush_annotations(timeout=0.5)
             self._backend._recorder_annotation_file.close()
             self._backend._recorder_annotation_file = None
             self._recorder.stop()
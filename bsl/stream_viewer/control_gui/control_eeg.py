@@ -7,6 +7,7 @@ from PyQt5.QtWidgets import QHeaderView, QTableWidgetItem, QInputDialog
 
 from ._control import _ControlGUI
 from ._ui_control import UI_MainWindow
+from ..backends.pyqtgraph import _BackendPyQtGraph
 from ...utils._logs import logger
 from ...utils._docs import fill_doc, copy_doc
 
@@ -20,10 +21,11 @@ class ControlGUI_EEG(_ControlGUI):
     ----------
     %(viewer_scope)s
     %(viewer_backend)s
+    %(viewer_useOpenGL)s
     """
 
-    def __init__(self, scope, backend):
-        super().__init__(scope, backend)
+    def __init__(self, scope, backend, useOpenGL=False):
+        super().__init__(scope, backend, useOpenGL)
         config_file = 'settings_scope_eeg.ini'
 
         self._load_configuration(config_file)
@@ -189,8 +191,11 @@ class ControlGUI_EEG(_ControlGUI):
         backend = _ControlGUI._check_backend(backend)
         geometry = (self.geometry().x()+self.width(), self.geometry().y(),
                     self.width()*2, self.height())
+        kwargs = dict()
+        if backend is _BackendPyQtGraph:
+            kwargs['useOpenGL'] = self._useOpenGL
         self._backend = backend(
-            self._scope, geometry, self._xRange, self._yRange)
+            self._scope, geometry, self._xRange, self._yRange, **kwargs)
 
     # --------------------------------------------------------------------
     @copy_doc(_ControlGUI._connect_signals_to_slots)
@@ -32,7 +32,7 @@ class StreamViewer:
     def __init__(self, stream_name=None):
         self._stream_name = StreamViewer._check_stream_name(stream_name)
 
-    def start(self, bufsize=0.2, backend='pyqtgraph'):
+    def start(self, bufsize=0.2, backend='pyqtgraph', useOpenGL=False):
         """
         Connect to the selected amplifier and plot the streamed data.
 
@@ -48,8 +48,14 @@ class StreamViewer:
             Selected backend for plotting. Supports:
                 - ``'pyqtgraph'``: fully functional.
                 - ``'vispy'``: work in progress.
+        useOpenGL : `bool`
+            If ``True``, the ``'pyqtgraph'`` backend renders the signals with
+            OpenGL when an OpenGL context is available. pyqtgraph's OpenGL
+            support is experimental. The ``'vispy'`` backend always renders
+            with OpenGL.
         """
         backend = StreamViewer._check_backend(backend)
+        _check_type(useOpenGL, (bool, ), item_name='useOpenGL')
 
         logger.info(f'Connecting to the stream: {self.stream_name}')
         self._sr = StreamReceiver(bufsize=bufsize, winsize=bufsize,
@@ -60,7 +66,7 @@ class StreamViewer:
         if isinstance(self._sr.streams[self._stream_name], StreamEEG):
             self._scope = ScopeEEG(self._sr, self._stream_name)
             app = QApplication(sys.argv)
-            self._ui = ControlGUI_EEG(self._scope, backend)
+            self._ui = ControlGUI_EEG(self._scope, backend, useOpenGL)
             sys.exit(app.exec_())
         else:
             logger.error(
@@ -109,6 +109,11 @@ yRange : float
 docdict['viewer_backend'] = """
 backend : str
     One of the supported backend's name. Supported 'vispy', 'pyqtgraph'."""
+docdict['viewer_useOpenGL'] = """
+useOpenGL : bool
+    If True, the pyqtgraph backend renders the canvas with OpenGL when an
+    OpenGL context is available. pyqtgraph's OpenGL support is experimental.
+    The vispy backend always renders with OpenGL."""
 docdict['viewer_scope_stream_receiver'] = """
 stream_receiver : StreamReceiver
     Connected StreamReceiver."""
@@ -0,0 +1,119 @@
+"""
+Largest-Triangle-Three-Buckets (LTTB) downsampling.
+From S. Steinarsson, Downsampling Time Series for Visual Representation, 2013.
+"""
+import numpy as np
+
+from ._imports import import_optional_dependency
+
+numba = import_optional_dependency("numba", raise_error=False)
+
+
+def lttb(x, y, n_out):
+    """
+    Downsample signals with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last samples are kept. The other samples are split in
+    n_out - 2 buckets, and the sample forming the largest triangle with the
+    sample kept in the previous bucket and the average of the next bucket is
+    kept. Contrary to averaging, fast transients are preserved.
+
+    Parameters
+    ----------
+    x : array of shape (n_samples,)
+        Sample positions, shared by all signals.
+    y : array of shape (n_signals, n_samples)
+        Signals to downsample.
+    n_out : int
+        Number of samples to keep, between 3 and n_samples.
+
+    Returns
+    -------
+    x_out : array of shape (n_signals, n_out)
+        Positions of the samples kept for each signal.
+    y_out : array of shape (n_signals, n_out)
+        Samples kept for each signal.
+    """
+    n_samples = y.shape[1]
+    assert 3 <= n_out <= n_samples
+    # bucket k spans samples [edges[k], edges[k+1])
+    edges = 1 + np.arange(n_out - 1) * (n_samples - 2) // (n_out - 2)
+    idx = _lttb_indices(x, y, n_out, edges)
+    return x[idx], np.take_along_axis(y, idx, axis=1)
+
+
+def _lttb_indices_numpy(x, y, n_out, edges):
+    """
+    Select the indices of the samples to keep for each signal, vectorized
+    across the signals.
+    """
+    n_signals, n_samples = y.shape
+    idx = np.empty((n_signals, n_out), dtype=np.intp)
+    idx[:, 0] = 0
+    idx[:, -1] = n_samples - 1
+
+    # average of each bucket, the last point being the last 'bucket'
+    counts = np.diff(edges)
+    avg_x = np.append(
+        np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])
+    avg_y = np.append(
+        np.add.reduceat(y[:, :-1], edges[:-1], axis=1) / counts,
+        y[:, -1:], axis=1)
+
+    signals = np.arange(n_signals)
+    a = np.zeros(n_signals, dtype=np.intp)
+    for k in range(n_out - 2):
+        start, stop = edges[k], edges[k+1]
+        ax = x[a][:, np.newaxis]
+        ay = y[signals, a][:, np.newaxis]
+        # twice the area of the triangles, the factor does not matter
+        areas = np.abs(
+            (ax - avg_x[k+1]) * (y[:, start:stop] - ay)
+            - (ax - x[start:stop]) * (avg_y[:, k+1:k+2] - ay))
+        a = start + np.argmax(areas, axis=1)
+        idx[:, k+1] = a
+    return idx
+
+
+def _lttb_indices_loops(x, y, n_out, edges):
+    """
+    Select the indices of the samples to keep for each signal, one sample at
+    a time. Compiled with numba when it is installed.
+    """
+    n_signals, n_samples = y.shape
+    idx = np.empty((n_signals, n_out), dtype=np.intp)
+    for s in range(n_signals):
+        idx[s, 0] = 0
+        idx[s, n_out-1] = n_samples - 1
+        a = 0
+        for k in range(n_out - 2):
+            # average of the next bucket, or last point
+            if k + 2 < n_out - 1:
+                avg_x = 0.
+                avg_y = 0.
+                for j in range(edges[k+1], edges[k+2]):
+                    avg_x += x[j]
+                    avg_y += y[s, j]
+                avg_x /= edges[k+2] - edges[k+1]
+                avg_y /= edges[k+2] - edges[k+1]
+            else:
+                avg_x = x[n_samples-1]
+                avg_y = y[s, n_samples-1]
+
+            ax = x[a]
+            ay = y[s, a]
+            max_area = -1.
+            for j in range(edges[k], edges[k+1]):
+                area = abs((ax - avg_x) * (y[s, j] - ay)
+                           - (ax - x[j]) * (avg_y - ay))
+                if area > max_area:
+                    max_area = area
+                    a = j
+            idx[s, k+1] = a
+    return idx
+
+
+if numba is None:
+    _lttb_indices = _lttb_indices_numpy
+else:
+    _lttb_indices = numba.njit(cache=True)(_lttb_indices_loops)
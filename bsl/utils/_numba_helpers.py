@@ -0,0 +1,59 @@
+"""
+Helpers compiled with numba when it is installed, with a numpy fallback.
+"""
+import numpy as np
+
+from ._imports import import_optional_dependency
+
+numba = import_optional_dependency("numba", raise_error=False)
+
+
+def decode_triggers(trigger_arr, duration_buffer, inv_sr, delta):
+    """
+    Find the trigger events, i.e. the non-zero samples, in the last chunk
+    of a trigger buffer.
+
+    Parameters
+    ----------
+    trigger_arr : array of shape (n_samples,)
+        Chunk of the trigger channel, ending at the end of the buffer.
+    duration_buffer : int | float
+        Duration of the buffer in seconds.
+    inv_sr : float
+        Inverse of the sampling rate in seconds.
+    delta : float
+        Offset in seconds between the buffer and the plotting window.
+
+    Returns
+    -------
+    values : array of shape (n_events,)
+        Values of the events.
+    pos_buf : array of shape (n_events,)
+        Positions of the events in the buffer in seconds.
+    pos_plot : array of shape (n_events,)
+        Positions of the events in the plotting window in seconds.
+    """
+    return _decode_triggers(trigger_arr, duration_buffer, inv_sr, delta)
+
+
+if numba is None:
+    def _decode_triggers(trigger_arr, duration_buffer, inv_sr, delta):
+        idx = np.flatnonzero(trigger_arr)
+        pos_buf = duration_buffer - (trigger_arr.shape[0] - idx) * inv_sr
+        return trigger_arr[idx], pos_buf, pos_buf - delta
+
+else:
+    @numba.njit(cache=True)
+    def _decode_triggers(trigger_arr, duration_buffer, inv_sr, delta):
+        n_samples = trigger_arr.shape[0]
+        values = np.empty(n_samples, dtype=trigger_arr.dtype)
+        pos_buf = np.empty(n_samples, dtype=np.float64)
+        n = 0
+        for k in range(n_samples):
+            if trigger_arr[k] != 0:
+                values[n] = trigger_arr[k]
+                pos_buf[n] = duration_buffer - (n_samples - k) * inv_sr
+                n += 1
+        values = values[:n]
+        pos_buf = pos_buf[:n]
+        return values, pos_buf, pos_buf - delta
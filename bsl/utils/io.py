@@ -1,8 +1,9 @@
 """
 Convert known file format to FIF.
 """
-import os
 import pickle
+import warnings
+from functools import lru_cache
 from pathlib import Path
 
 import mne
@@ -54,28 +55,32 @@ def pcl2fif(fname, out_dir=None, external_event=None, external_annotation=None,
         out_dir = Path(out_dir)
     else:
         out_dir = fname.parent / 'fif'
-    os.makedirs(out_dir, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-    fiffile = out_dir / str(fname.stem + '.fif')
+    fiffile = out_dir / (fname.stem + '.fif')
 
-    # Load from file
+    # Load from file. With protocol 5, the arrays are read directly in their
+    # buffer and are not copied again. The file is neither read in memory
+    # first nor memory-mapped: the buffers would still be copied out of the
+    # bytes or the mapping, which is slower than reading them from the file.
     with open(fname, 'rb') as file:
         data = pickle.load(file)
 
     # MNE format
     raw = _format_pcl_to_mne_RawArray(data)
+    # release the loaded signals, unless raw shares them, before saving
+    offset = data["timestamps"][0]
+    del data
 
     # Add events from txt file
     if external_event is not None:
-        events = _load_events_from_txt(raw.times, external_event,
-                                       data["timestamps"][0])
+        events = _load_events_from_txt(raw.times, external_event, offset)
         if 0 < len(events):
             raw.add_events(events, stim_channel='TRIGGER', replace=replace)
 
     # Add annotation from txt file
     if external_annotation is not None:
-        annotations = _load_annotations_from_txt(external_annotation,
-                                                 data["timestamps"][0])
+        annotations = _load_annotations_from_txt(external_annotation, offset)
         if 0 < len(annotations):
             raw.set_annotations(annotations)
 
@@ -88,11 +93,19 @@ def _format_pcl_to_mne_RawArray(data):
     """
     Format the raw data to the MNE RawArray structure.
     Data must be recorded with BSL StreamRecorder.
+
+    If the trigger channel is not the first channel, it is moved to index 0 in
+    place when data['signals'] is a writeable float64 array, which modifies
+    data['signals'].
     """
     if isinstance(data['signals'], list):
-        signals_raw = np.array(data['signals'][0]).T    # to channels x samples
+        signals_raw = np.asarray(data['signals'][0]).T  # to channels x samples
     else:
         signals_raw = data['signals'].T                 # to channels x samples
+    if signals_raw.size == 0:
+        raise ValueError('The recording does not contain any sample.')
+    # RawArray stores float64, cast once before re-ordering the channels
+    signals_raw = signals_raw.astype(np.float64, copy=False)
 
     sample_rate = data['sample_rate']
 
@@ -102,11 +115,14 @@ def _format_pcl_to_mne_RawArray(data):
     else:
         ch_names = data['ch_names']
 
-    # search for the trigger channel
-    trig_ch = find_event_channel(signals_raw, ch_names)
-    # TODO: patch to be improved for multi-trig channel recording
-    if isinstance(trig_ch, list):
-        trig_ch = trig_ch[0]
+    # search for the trigger channel, named 'TRIGGER' by StreamRecorder
+    if 'TRIGGER' in ch_names:
+        trig_ch = ch_names.index('TRIGGER')
+    else:
+        trig_ch = find_event_channel(signals_raw, ch_names)
+        # TODO: patch to be improved for multi-trig channel recording
+        if isinstance(trig_ch, list):
+            trig_ch = trig_ch[0]
 
     # move trigger channel to index 0
     if trig_ch is None:
@@ -114,8 +130,10 @@ def _format_pcl_to_mne_RawArray(data):
         logger.warning(
             'Event channel was not found. '
             'Adding a blank event channel to index 0.')
-        eventch = np.zeros([1, signals_raw.shape[1]])
-        signals = np.concatenate((eventch, signals_raw), axis=0)
+        signals = np.empty((signals_raw.shape[0] + 1, signals_raw.shape[1]),
+                           dtype=signals_raw.dtype)
+        signals[0] = 0
+        signals[1:] = signals_raw
         # data['channels'] is not reliable any more
         num_eeg_channels = signals_raw.shape[0]
         trig_ch = 0
@@ -127,11 +145,21 @@ def _format_pcl_to_mne_RawArray(data):
 
     else:
         logger.info('Moving event channel %s to 0.', trig_ch)
-        signals = np.concatenate((signals_raw[[trig_ch]],
-                                  signals_raw[:trig_ch],
-                                  signals_raw[trig_ch + 1:]),
-                                 axis=0)
-        assert signals_raw.shape == signals.shape
+        # trigger channel first, others in order
+        if signals_raw.flags.writeable:
+            # rotate the rows in place to avoid holding a second copy of the
+            # recording in memory
+            signals = signals_raw
+            trigger = signals[trig_ch].copy()
+            for k in range(trig_ch, 0, -1):
+                signals[k] = signals[k - 1]
+            signals[0] = trigger
+        else:
+            # single row permutation
+            perm = np.arange(signals_raw.shape[0])
+            perm[1:trig_ch + 1] = perm[:trig_ch]
+            perm[0] = trig_ch
+            signals = signals_raw[perm]
         num_eeg_channels = data['channels'] - 1
         ch_names.pop(trig_ch)
         trig_ch = 0
@@ -141,38 +169,50 @@ def _format_pcl_to_mne_RawArray(data):
             logger.info('%s', channel)
 
     ch_info = ['stim'] + ['eeg'] * num_eeg_channels
-    info = mne.create_info(ch_names, sample_rate, ch_info)
+    info = _create_info(tuple(ch_names), sample_rate, tuple(ch_info))
 
-    # create Raw object
+    # create Raw object, RawArray works on a copy of the cached info
     raw = mne.io.RawArray(signals, info)
 
     return raw
 
 
+@lru_cache(maxsize=16)
+def _create_info(ch_names, sample_rate, ch_info):
+    """
+    Create the measurement info, cached for batch conversions of recordings
+    sharing the same channels and sampling rate. Arguments must be hashable.
+    """
+    return mne.create_info(list(ch_names), sample_rate, list(ch_info))
+
+
 def _load_events_from_txt(raw_times, eve_file, offset):
     """
     Load events delivered by the software trigger from the event txt file, and
     convert LSL timestamps to indices.
     """
+    with warnings.catch_warnings():
+        # an empty file has no event, no need for loadtxt's warning
+        warnings.simplefilter('ignore', UserWarning)
+        data = np.loadtxt(eve_file, delimiter='\t', usecols=(0, 2),
+                          ndmin=2)
+    events_ts = data[:, 0] - offset
+    events_values = data[:, 1].astype(int)
+
+    # look up the indices of all the events at once, bisect_left per event
+    # would first need raw_times as a list, which costs more than the lookup
+    next_indexes = np.searchsorted(raw_times, events_ts)
+    valid = next_indexes < len(raw_times)
+    # raw_times is sorted, the time range is given by its first and last times
+    for event_value, event_ts in zip(events_values[~valid],
+                                     events_ts[~valid]):
+        logger.warning(
+            'Event %d at time %.3f is out of time range (%.3f - %.3f).',
+            event_value, event_ts, raw_times[0], raw_times[-1])
 
-    ts_min = min(raw_times)
-    ts_max = max(raw_times)
-    events = []
-
-    with open(eve_file, 'r') as file:
-        for line in file:
-            data = line.strip().split('\t')
-            event_ts = float(data[0]) - offset
-            event_value = int(data[2])
-            next_index = np.searchsorted(raw_times, event_ts)
-            if next_index >= len(raw_times):
-                logger.warning(
-                    'Event %d at time %.3f is out of time range (%.3f - %.3f).'
-                    % (event_value, event_ts, ts_min, ts_max))
-            else:
-                events.append([next_index, 0, event_value])
-
-    return np.array(events)
+    return np.column_stack((next_indexes[valid],
+                            np.zeros(np.count_nonzero(valid), dtype=int),
+                            events_values[valid]))
 
 
 def _load_annotations_from_txt(annotation_file, offset):
@@ -180,20 +220,28 @@ def _load_annotations_from_txt(annotation_file, offset):
     Load annotations marked with the StreamViewer from the annotation txt file.
     """
 
-    onsets, durations, descriptions = list(), list(), list()
-    with open(annotation_file, 'r') as file:
-        for line in file:
-            data = line.strip().split()
-            onsets.append(float(data[0]) - offset)
-            durations.append(float(data[1]))
-            descriptions.append(data[2])
+    with warnings.catch_warnings():
+        # an empty file has no annotation, no need for loadtxt's warning
+        warnings.simplefilter('ignore', UserWarning)
+        data = np.loadtxt(annotation_file, dtype=str, usecols=(0, 1, 2),
+                          ndmin=2)
+    if data.size == 0:
+        return mne.Annotations([], [], [])
+
+    onsets = data[:, 0].astype(np.float64) - offset
+    durations = data[:, 1].astype(np.float64)
+    descriptions = data[:, 2].tolist()
 
     return mne.Annotations(onsets, durations, descriptions)
 
 
 # ------------------------- General converter -------------------------
-# Edit readers with BSL '.pcl' reader.
-supported['.pcl'] = pcl2fif
+def _register_pcl_reader():
+    """
+    Edit MNE readers with BSL '.pcl' reader. Called by any2fif instead of on
+    import, to leave MNE's readers untouched until a file is converted.
+    """
+    supported.setdefault('.pcl', pcl2fif)
 
 
 def any2fif(fname, out_dir=None, overwrite=True, precision='double'):
@@ -214,6 +262,8 @@ def any2fif(fname, out_dir=None, overwrite=True, precision='double'):
         Data matrix format. ``[single|double|int|short]``, ``'single'``
         improves backward compatability.
     """
+    _register_pcl_reader()
+
     fname = Path(fname)
     if not fname.is_file():
         raise IOError('File %s not found.' % fname)
@@ -236,9 +286,9 @@ def any2fif(fname, out_dir=None, overwrite=True, precision='double'):
             out_dir = Path(out_dir)
         else:
             out_dir = fname.parent / 'fif'
-        os.makedirs(out_dir, exist_ok=True)
+        out_dir.mkdir(parents=True, exist_ok=True)
 
-        fiffile = out_dir / fname.stem + '.fif'
+        fiffile = out_dir / (fname.stem + '.fif')
 
         raw = mne.io.read_raw(fname)
         raw.save(fiffile, verbose=False, overwrite=overwrite, fmt=precision)
@@ -0,0 +1,85 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from bsl.utils.io import (_format_pcl_to_mne_RawArray, _load_events_from_txt,
+                          _load_annotations_from_txt)
+
+
+@pytest.mark.parametrize('writeable', (True, False))
+def test_format_pcl_to_mne_RawArray(writeable):
+    """Test moving the trigger channel to index 0."""
+    signals = np.arange(40, dtype=np.float64).reshape(10, 4)
+    signals[:, 2] = 0
+    signals[::3, 2] = 1
+    expected = signals.T[[2, 0, 1, 3]].copy()
+    signals.flags.writeable = writeable
+    data = dict(signals=signals, sample_rate=100., channels=4,
+                ch_names=['A', 'B', 'TRIGGER', 'C'])
+
+    raw = _format_pcl_to_mne_RawArray(data)
+    assert raw.ch_names == ['TRIGGER', 'A', 'B', 'C']
+    assert raw.get_channel_types() == ['stim', 'eeg', 'eeg', 'eeg']
+    assert np.array_equal(raw.get_data(), expected)
+
+
+def test_load_events_from_txt(tmp_path, caplog):
+    """Test loading the events from the software trigger file."""
+    raw_times = np.arange(1000) / 100
+    offset = 1000.
+    fname = tmp_path / 'eve.txt'
+
+    # events in and out of the time range
+    with open(fname, 'w') as file:
+        for ts, value in ((1.0, 5), (3.504, 6), (50.0, 7)):
+            file.write('%.6f\t0\t%d\n' % (offset + ts, value))
+    events = _load_events_from_txt(raw_times, fname, offset)
+    assert np.array_equal(events, [[100, 0, 5], [351, 0, 6]])
+    assert 'Event 7 at time 50.000 is out of time range' in caplog.text
+
+    # single event
+    with open(fname, 'w') as file:
+        file.write('%.6f\t0\t%d\n' % (offset + 2.0, 3))
+    events = _load_events_from_txt(raw_times, fname, offset)
+    assert np.array_equal(events, [[200, 0, 3]])
+
+    # empty file
+    with open(fname, 'w') as file:
+        pass
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        events = _load_events_from_txt(raw_times, fname, offset)
+    assert events.shape == (0, 3)
+
+
+def test_load_annotations_from_txt(tmp_path):
+    """Test loading the annotations from the StreamViewer file."""
+    offset = 1000.
+    fname = tmp_path / 'annotations.txt'
+
+    # several annotations
+    with open(fname, 'w') as file:
+        file.write('1001.500000 0.250000 bad\n')
+        file.write('1003.000000 1.000000 bad_muscle\n')
+    annotations = _load_annotations_from_txt(fname, offset)
+    assert len(annotations) == 2
+    assert np.allclose(annotations.onset, [1.5, 3.])
+    assert np.allclose(annotations.duration, [0.25, 1.])
+    assert list(annotations.description) == ['bad', 'bad_muscle']
+
+    # single annotation
+    with open(fname, 'w') as file:
+        file.write('1002.000000 0.500000 bad\n')
+    annotations = _load_annotations_from_txt(fname, offset)
+    assert len(annotations) == 1
+    assert np.allclose(annotations.onset, [2.])
+    assert list(annotations.description) == ['bad']
+
+    # empty file
+    with open(fname, 'w') as file:
+        pass
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        annotations = _load_annotations_from_txt(fname, offset)
+    assert len(annotations) == 0
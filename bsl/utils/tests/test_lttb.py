@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from bsl.utils._lttb import lttb, _lttb_indices_loops, _lttb_indices_numpy
+
+
+@pytest.mark.parametrize('n_samples, n_out', [(5120, 800), (100, 3),
+                                              (1001, 1000)])
+def test_lttb_indices(n_samples, n_out):
+    """Test that the implementations of LTTB select the same samples."""
+    numba = pytest.importorskip('numba')
+    rng = np.random.default_rng(0)
+    x = np.arange(n_samples, dtype=np.float32) / 512
+    y = rng.standard_normal((8, n_samples)).astype(np.float32)
+    edges = 1 + np.arange(n_out - 1) * (n_samples - 2) // (n_out - 2)
+
+    idx = _lttb_indices_numpy(x, y, n_out, edges)
+    idx_numba = numba.njit(_lttb_indices_loops)(x, y, n_out, edges)
+    assert np.array_equal(idx, idx_numba)
+    assert idx.shape == (8, n_out)
+    assert (idx[:, 0] == 0).all() and (idx[:, -1] == n_samples - 1).all()
+    assert (np.diff(idx, axis=1) > 0).all()
+
+
+def test_lttb():
+    """Test LTTB downsampling of signals."""
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros((2, 1000))
+    y[0, 500] = 10  # transient preserved by LTTB
+    x_out, y_out = lttb(x, y, 100)
+    assert x_out.shape == y_out.shape == (2, 100)
+    assert y_out[0].max() == 10
+    assert (y_out[1] == 0).all()
+    assert np.array_equal(x_out[0, [0, -1]], [0, 999])